@@ -4,61 +4,252 @@
 complete -c datamesh -s f -l format -d "Output format" -xa "table json compact csv"
 complete -c datamesh -s v -l verbose -d "Verbose output"
 complete -c datamesh -l no-color -d "Disable colored output"
-complete -c datamesh -s c -l config -d "Configuration file" -r
+complete -c datamesh -s c -l config -d "Configuration file" -rF
 complete -c datamesh -s i -l interactive -d "Interactive mode"
 complete -c datamesh -l dry-run -d "Show what would be done"
 complete -c datamesh -s h -l help -d "Show help"
 
+# Command path helpers: the words typed so far, minus options and their values
+function __datamesh_command_path
+    set -l skip 0
+    set -l words (commandline -opc)
+    set -e words[1]
+    for word in $words
+        if test $skip = 1
+            set skip 0
+        else if contains -- $word --format -f --config -c --add --bind --duration --email --expires --limit --lines --memo --name --output -o --output-dir --password --port --private-key --proposal-type --public-key --reason --remove --tags --test-type --with
+            set skip 1
+        else if not string match -q -- '-*' $word
+            echo $word
+        end
+    end
+end
+
+# True when the typed command path is exactly the given words
+function __datamesh_at_command
+    set -l path (__datamesh_command_path)
+    test "$path" = "$argv"
+end
+
+# True once the typed command path starts with the given words
+function __datamesh_seen_command
+    set -l path (__datamesh_command_path)
+    set -l n (count $argv)
+    test (count $path) -ge $n; or return 1
+    test "$path[1..$n]" = "$argv"
+end
+
 # Main commands
-complete -c datamesh -f -n "__fish_use_subcommand" -a "file" -d "File operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "network" -d "Network operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "system" -d "System operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "governance" -d "Governance operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "interactive" -d "Start interactive shell"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "service" -d "Service management"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "status" -d "Show system status"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "guide" -d "Getting started guide"
+complete -c datamesh -f -n "__datamesh_at_command" -a "file" -d "File operations"
+complete -c datamesh -f -n "__datamesh_at_command" -a "network" -d "Network operations"
+complete -c datamesh -f -n "__datamesh_at_command" -a "system" -d "System operations"
+complete -c datamesh -f -n "__datamesh_at_command" -a "governance" -d "Governance operations"
+complete -c datamesh -f -n "__datamesh_at_command" -a "interactive" -d "Start interactive shell"
+complete -c datamesh -f -n "__datamesh_at_command" -a "service" -d "Service management"
+complete -c datamesh -f -n "__datamesh_at_command" -a "status" -d "Show system status"
+complete -c datamesh -f -n "__datamesh_at_command" -a "guide" -d "Getting started guide"
 
 # File subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "put" -d "Store a file"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "get" -d "Retrieve a file"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "list" -d "List files"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "search" -d "Search files"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "batch" -d "Batch operations"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "share" -d "Share files"
+complete -c datamesh -f -n "__datamesh_at_command file" -a "put" -d "Store a file in the network"
+complete -c datamesh -f -n "__datamesh_at_command file" -a "get" -d "Retrieve a file from the network"
+complete -c datamesh -f -n "__datamesh_at_command file" -a "list" -d "List files"
+complete -c datamesh -f -n "__datamesh_at_command file" -a "search" -d "Search files"
+complete -c datamesh -f -n "__datamesh_at_command file" -a "batch" -d "Batch operations"
+complete -c datamesh -f -n "__datamesh_at_command file" -a "share" -d "Share files"
 
 # File put options
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from put" -l name -d "Custom file name"
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from put" -l tags -d "File tags"
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from put" -l public-key -d "Public key for encryption"
+complete -c datamesh -n "__datamesh_seen_command file put" -l name -d "Custom file name" -x
+complete -c datamesh -n "__datamesh_seen_command file put" -l tags -d "File tags" -x
+complete -c datamesh -n "__datamesh_seen_command file put" -l public-key -d "Public key for encryption" -x
 
 # File get options
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from get" -s o -l output -d "Output path" -r
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from get" -l private-key -d "Private key for decryption"
+complete -c datamesh -n "__datamesh_seen_command file get" -s o -l output -d "Output path" -rF
+complete -c datamesh -n "__datamesh_seen_command file get" -l private-key -d "Private key for decryption" -x
+
+# File list options
+complete -c datamesh -n "__datamesh_seen_command file list" -l tags -d "File tags" -x
+complete -c datamesh -n "__datamesh_seen_command file list" -l public-key -d "Public key for encryption" -x
+complete -c datamesh -n "__datamesh_seen_command file list" -l long -d "Detailed output"
+
+# File search options
+complete -c datamesh -n "__datamesh_seen_command file search" -l content -d "Search file contents"
+complete -c datamesh -n "__datamesh_seen_command file search" -l limit -d "Maximum number of results" -x
+
+# File batch subcommands
+complete -c datamesh -f -n "__datamesh_at_command file batch" -a "put"
+complete -c datamesh -f -n "__datamesh_at_command file batch" -a "get"
+complete -c datamesh -f -n "__datamesh_at_command file batch" -a "tag"
+
+# File batch put options
+complete -c datamesh -n "__datamesh_seen_command file batch put" -l preserve-structure -d "Preserve directory structure"
+
+# File batch get options
+complete -c datamesh -n "__datamesh_seen_command file batch get" -l output-dir -d "Output directory" -rF
+
+# File batch tag options
+complete -c datamesh -n "__datamesh_seen_command file batch tag" -l add -d "Tags to add" -x
+complete -c datamesh -n "__datamesh_seen_command file batch tag" -l remove -d "Tags to remove" -x
+
+# File share options
+complete -c datamesh -n "__datamesh_seen_command file share" -l with -d "Share with user" -x
+complete -c datamesh -n "__datamesh_seen_command file share" -l public -d "Share publicly"
+complete -c datamesh -n "__datamesh_seen_command file share" -l expires -d "Expiration time" -x
 
 # Network subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "peers" -d "Show peer information"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "health" -d "Network health check"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "topology" -d "Network topology"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "bandwidth" -d "Bandwidth testing"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "bootstrap" -d "Bootstrap management"
+complete -c datamesh -f -n "__datamesh_at_command network" -a "peers" -d "Show peer information"
+complete -c datamesh -f -n "__datamesh_at_command network" -a "health" -d "Network health check"
+complete -c datamesh -f -n "__datamesh_at_command network" -a "topology" -d "Network topology analysis"
+complete -c datamesh -f -n "__datamesh_at_command network" -a "bandwidth" -d "Bandwidth testing"
+complete -c datamesh -f -n "__datamesh_at_command network" -a "bootstrap" -d "Bootstrap node management"
+
+# Network peers options
+complete -c datamesh -n "__datamesh_seen_command network peers" -l long -d "Detailed output"
+complete -c datamesh -n "__datamesh_seen_command network peers" -l status -d "Show peer status"
+
+# Network health options
+complete -c datamesh -n "__datamesh_seen_command network health" -l full -d "Full health check"
+complete -c datamesh -n "__datamesh_seen_command network health" -l monitor -d "Keep monitoring"
+
+# Network topology options
+complete -c datamesh -n "__datamesh_seen_command network topology" -l routing -d "Show routing table"
+complete -c datamesh -n "__datamesh_seen_command network topology" -s o -l output -d "Output path" -rF
+
+# Network bandwidth options
+complete -c datamesh -n "__datamesh_seen_command network bandwidth" -l duration -d "Duration" -x
+
+# Network bootstrap subcommands
+complete -c datamesh -f -n "__datamesh_at_command network bootstrap" -a "start"
+complete -c datamesh -f -n "__datamesh_at_command network bootstrap" -a "stop"
+complete -c datamesh -f -n "__datamesh_at_command network bootstrap" -a "list"
+complete -c datamesh -f -n "__datamesh_at_command network bootstrap" -a "add"
+complete -c datamesh -f -n "__datamesh_at_command network bootstrap" -a "remove"
+
+# Network bootstrap start options
+complete -c datamesh -n "__datamesh_seen_command network bootstrap start" -l port -d "Port to listen on" -x
 
 # System subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "config" -d "Configuration management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "stats" -d "Statistics and metrics"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "storage" -d "Storage management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "api" -d "API server management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "benchmark" -d "Run benchmarks"
+complete -c datamesh -f -n "__datamesh_at_command system" -a "config" -d "Configuration management"
+complete -c datamesh -f -n "__datamesh_at_command system" -a "stats" -d "Statistics and metrics"
+complete -c datamesh -f -n "__datamesh_at_command system" -a "storage" -d "Storage management"
+complete -c datamesh -f -n "__datamesh_at_command system" -a "api" -d "API server management"
+complete -c datamesh -f -n "__datamesh_at_command system" -a "benchmark" -d "Run benchmarks"
+
+# System config subcommands
+complete -c datamesh -f -n "__datamesh_at_command system config" -a "show"
+complete -c datamesh -f -n "__datamesh_at_command system config" -a "set"
+complete -c datamesh -f -n "__datamesh_at_command system config" -a "get"
+complete -c datamesh -f -n "__datamesh_at_command system config" -a "init"
+complete -c datamesh -f -n "__datamesh_at_command system config" -a "validate"
+
+# System config init options
+complete -c datamesh -n "__datamesh_seen_command system config init" -s o -l output -d "Output path" -rF
+complete -c datamesh -n "__datamesh_seen_command system config init" -l force -d "Overwrite existing files"
+
+# System stats options
+complete -c datamesh -n "__datamesh_seen_command system stats" -l long -d "Detailed output"
+complete -c datamesh -n "__datamesh_seen_command system stats" -l watch -d "Refresh continuously"
+
+# System storage subcommands
+complete -c datamesh -f -n "__datamesh_at_command system storage" -a "cleanup"
+complete -c datamesh -f -n "__datamesh_at_command system storage" -a "repair"
+complete -c datamesh -f -n "__datamesh_at_command system storage" -a "optimize"
+complete -c datamesh -f -n "__datamesh_at_command system storage" -a "quota"
+
+# System storage cleanup options
+complete -c datamesh -n "__datamesh_seen_command system storage cleanup" -l orphaned -d "Remove orphaned chunks"
+complete -c datamesh -n "__datamesh_seen_command system storage cleanup" -l compact -d "Compact storage"
+
+# System storage repair options
+complete -c datamesh -n "__datamesh_seen_command system storage repair" -l integrity -d "Check integrity"
+complete -c datamesh -n "__datamesh_seen_command system storage repair" -l fix -d "Repair problems found"
+
+# System storage optimize options
+complete -c datamesh -n "__datamesh_seen_command system storage optimize" -l defrag -d "Defragment storage"
+complete -c datamesh -n "__datamesh_seen_command system storage optimize" -l rebalance -d "Rebalance storage"
+
+# System storage quota options
+complete -c datamesh -n "__datamesh_seen_command system storage quota" -l long -d "Detailed output"
+
+# System api subcommands
+complete -c datamesh -f -n "__datamesh_at_command system api" -a "start"
+complete -c datamesh -f -n "__datamesh_at_command system api" -a "stop"
+complete -c datamesh -f -n "__datamesh_at_command system api" -a "status"
+complete -c datamesh -f -n "__datamesh_at_command system api" -a "docs"
+
+# System api start options
+complete -c datamesh -n "__datamesh_seen_command system api start" -l port -d "Port to listen on" -x
+complete -c datamesh -n "__datamesh_seen_command system api start" -l bind -d "Address to bind" -x
+
+# System api docs options
+complete -c datamesh -n "__datamesh_seen_command system api docs" -l format -d "Output format" -x
+complete -c datamesh -n "__datamesh_seen_command system api docs" -s o -l output -d "Output path" -rF
+
+# System benchmark options
+complete -c datamesh -n "__datamesh_seen_command system benchmark" -l test-type -d "Benchmark type" -x
+complete -c datamesh -n "__datamesh_seen_command system benchmark" -l duration -d "Duration" -x
 
 # Governance subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "user" -d "User management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "proposal" -d "Proposal management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "vote" -d "Vote on proposals"
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "economics" -d "Economic operations"
+complete -c datamesh -f -n "__datamesh_at_command governance" -a "user" -d "User management"
+complete -c datamesh -f -n "__datamesh_at_command governance" -a "proposal" -d "Proposal management"
+complete -c datamesh -f -n "__datamesh_at_command governance" -a "vote" -d "Vote on proposals"
+complete -c datamesh -f -n "__datamesh_at_command governance" -a "economics" -d "Economic operations"
+
+# Governance user subcommands
+complete -c datamesh -f -n "__datamesh_at_command governance user" -a "register"
+complete -c datamesh -f -n "__datamesh_at_command governance user" -a "login"
+complete -c datamesh -f -n "__datamesh_at_command governance user" -a "profile"
+complete -c datamesh -f -n "__datamesh_at_command governance user" -a "update"
+
+# Governance user register options
+complete -c datamesh -n "__datamesh_seen_command governance user register" -l password -d "Account password" -x
+
+# Governance user login options
+complete -c datamesh -n "__datamesh_seen_command governance user login" -l password -d "Account password" -x
+
+# Governance user update options
+complete -c datamesh -n "__datamesh_seen_command governance user update" -l email -d "Account email" -x
+complete -c datamesh -n "__datamesh_seen_command governance user update" -l password -d "Account password" -x
+
+# Governance proposal subcommands
+complete -c datamesh -f -n "__datamesh_at_command governance proposal" -a "list"
+complete -c datamesh -f -n "__datamesh_at_command governance proposal" -a "create"
+complete -c datamesh -f -n "__datamesh_at_command governance proposal" -a "show"
+
+# Governance proposal list options
+complete -c datamesh -n "__datamesh_seen_command governance proposal list" -l active -d "Only active proposals"
+complete -c datamesh -n "__datamesh_seen_command governance proposal list" -l proposal-type -d "Proposal type" -x
+
+# Governance proposal create options
+complete -c datamesh -n "__datamesh_seen_command governance proposal create" -l proposal-type -d "Proposal type" -x
+
+# Governance vote options
+complete -c datamesh -n "__datamesh_seen_command governance vote" -l reason -d "Reason for the vote" -x
+
+# Governance economics subcommands
+complete -c datamesh -f -n "__datamesh_at_command governance economics" -a "balance"
+complete -c datamesh -f -n "__datamesh_at_command governance economics" -a "transfer"
+complete -c datamesh -f -n "__datamesh_at_command governance economics" -a "stake"
+complete -c datamesh -f -n "__datamesh_at_command governance economics" -a "history"
+
+# Governance economics transfer options
+complete -c datamesh -n "__datamesh_seen_command governance economics transfer" -l memo -d "Transfer memo" -x
+
+# Governance economics stake options
+complete -c datamesh -n "__datamesh_seen_command governance economics stake" -l duration -d "Duration" -x
+
+# Governance economics history options
+complete -c datamesh -n "__datamesh_seen_command governance economics history" -l limit -d "Maximum number of results" -x
 
 # Service subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "start" -d "Start service"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "stop" -d "Stop service"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "restart" -d "Restart service"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "status" -d "Service status"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "logs" -d "Show service logs"
+complete -c datamesh -f -n "__datamesh_at_command service" -a "start" -d "Start service"
+complete -c datamesh -f -n "__datamesh_at_command service" -a "stop" -d "Stop service"
+complete -c datamesh -f -n "__datamesh_at_command service" -a "restart" -d "Restart service"
+complete -c datamesh -f -n "__datamesh_at_command service" -a "status" -d "Service status"
+complete -c datamesh -f -n "__datamesh_at_command service" -a "logs" -d "Show service logs"
+
+# Service start options
+complete -c datamesh -n "__datamesh_seen_command service start" -l foreground -d "Run in the foreground"
+
+# Service logs options
+complete -c datamesh -n "__datamesh_seen_command service logs" -l follow -d "Follow log output"
+complete -c datamesh -n "__datamesh_seen_command service logs" -l lines -d "Number of lines to show" -x
@@ -6,8 +6,9 @@ This script generates shell completion files for bash, zsh, and fish
 based on the DataMesh CLI command structure.
 """
 
-import os
-import json
+import functools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # DataMesh command structure
@@ -173,11 +174,11 @@ COMMANDS = {
     "service": {
         "description": "Service management",
         "subcommands": {
-            "start": {"options": ["--foreground"], "args": []},
-            "stop": {"options": [], "args": []},
-            "restart": {"options": [], "args": []},
-            "status": {"options": [], "args": []},
-            "logs": {"options": ["--follow", "--lines"], "args": []}
+            "start": {"description": "Start service", "options": ["--foreground"], "args": []},
+            "stop": {"description": "Stop service", "options": [], "args": []},
+            "restart": {"description": "Restart service", "options": [], "args": []},
+            "status": {"description": "Service status", "options": [], "args": []},
+            "logs": {"description": "Show service logs", "options": ["--follow", "--lines"], "args": []}
         }
     },
     "status": {
@@ -203,31 +204,183 @@ GLOBAL_OPTIONS = [
     "--help", "-h"
 ]
 
-def generate_bash_completion():
-    """Generate bash completion script"""
-    script = '''#!/bin/bash
+# Help text and value completion for each global option, keyed by long name.
+# The value is None for flags, "file" for paths, or a tuple of choices.
+GLOBAL_OPTION_HELP = {
+    "--format": ("Output format", ("table", "json", "compact", "csv")),
+    "--verbose": ("Verbose output", None),
+    "--no-color": ("Disable colored output", None),
+    "--config": ("Configuration file", "file"),
+    "--interactive": ("Interactive mode", None),
+    "--dry-run": ("Show what would be done", None),
+    "--help": ("Show help", None),
+}
+
+def _parse_global_options(options):
+    """Pair each long global option with the short alias listed after it"""
+    pairs = []
+    for option in options:
+        if option.startswith("--"):
+            pairs.append([None, option])
+        else:
+            pairs[-1][0] = option
+    return tuple(
+        (short, long, *GLOBAL_OPTION_HELP[long])
+        for short, long in pairs
+    )
+
+# (short, long, description, value) per global option, derived from GLOBAL_OPTIONS
+_GLOBAL_SPECS = _parse_global_options(GLOBAL_OPTIONS)
+
+# Sorted for the prefix scan in the generated bash script
+_BASH_GLOBAL = " ".join(sorted(GLOBAL_OPTIONS))
+
+# Argument placeholders that name a local path and get file completion
+FILE_ARGS = {"<file_path>", "[file]"}
+
+# Short alias, help text and value for subcommand options, keyed by long
+# name. The value is None for flags, "file" for paths, or the name of the
+# free-form value the option takes. Options missing here are plain flags.
+OPTION_HELP = {
+    "--name": (None, "Custom file name", "name"),
+    "--tags": (None, "File tags", "tags"),
+    "--public-key": (None, "Public key for encryption", "key"),
+    "--private-key": (None, "Private key for decryption", "key"),
+    "--output": ("-o", "Output path", "file"),
+    "--output-dir": (None, "Output directory", "file"),
+    "--long": (None, "Detailed output", None),
+    "--content": (None, "Search file contents", None),
+    "--limit": (None, "Maximum number of results", "limit"),
+    "--preserve-structure": (None, "Preserve directory structure", None),
+    "--add": (None, "Tags to add", "tags"),
+    "--remove": (None, "Tags to remove", "tags"),
+    "--with": (None, "Share with user", "user"),
+    "--public": (None, "Share publicly", None),
+    "--expires": (None, "Expiration time", "time"),
+    "--status": (None, "Show peer status", None),
+    "--full": (None, "Full health check", None),
+    "--monitor": (None, "Keep monitoring", None),
+    "--routing": (None, "Show routing table", None),
+    "--duration": (None, "Duration", "duration"),
+    "--port": (None, "Port to listen on", "port"),
+    "--force": (None, "Overwrite existing files", None),
+    "--watch": (None, "Refresh continuously", None),
+    "--orphaned": (None, "Remove orphaned chunks", None),
+    "--compact": (None, "Compact storage", None),
+    "--integrity": (None, "Check integrity", None),
+    "--fix": (None, "Repair problems found", None),
+    "--defrag": (None, "Defragment storage", None),
+    "--rebalance": (None, "Rebalance storage", None),
+    "--bind": (None, "Address to bind", "address"),
+    "--format": (None, "Output format", "format"),
+    "--test-type": (None, "Benchmark type", "type"),
+    "--password": (None, "Account password", "password"),
+    "--email": (None, "Account email", "email"),
+    "--active": (None, "Only active proposals", None),
+    "--proposal-type": (None, "Proposal type", "type"),
+    "--reason": (None, "Reason for the vote", "reason"),
+    "--memo": (None, "Transfer memo", "memo"),
+    "--foreground": (None, "Run in the foreground", None),
+    "--follow": (None, "Follow log output", None),
+    "--lines": (None, "Number of lines to show", "lines"),
+}
+
+def _option_help(option):
+    """(short, description, value) for a subcommand option, a bare flag if unlisted"""
+    return OPTION_HELP.get(option, (None, "", None))
+
+# Options whose value is a local path
+PATH_OPTIONS = {option for option, (_, _, value) in OPTION_HELP.items() if value == "file"}
+
+# Options taking a free-form value; global ones complete their own values
+VALUE_OPTIONS = {
+    option for option, (_, _, value) in OPTION_HELP.items()
+    if value not in (None, "file") and option not in GLOBAL_OPTION_HELP
+}
+
+# One node of the command tree, addressed by its full command path
+Command = namedtuple("Command", ["path", "description", "options", "args", "subcommands"])
+
+def _walk(commands, prefix):
+    """Yield a Command for every node of a command tree, parents first"""
+    for name, spec in commands.items():
+        path = (*prefix, name)
+        subcommands = spec.get("subcommands", {})
+        yield Command(
+            path,
+            spec.get("description", ""),
+            tuple(spec.get("options", [])),
+            tuple(spec.get("args", [])),
+            tuple(subcommands),
+        )
+        yield from _walk(subcommands, path)
+
+@functools.lru_cache(maxsize=1)
+def _flat():
+    """Flatten COMMANDS once; every shell generator iterates the same result"""
+    return tuple(_walk(COMMANDS, ()))
+
+def _children(command, by_path):
+    """Resolve the subcommands of a Command to their own Command entries"""
+    return [by_path[(*command.path, name)] for name in command.subcommands]
+
+_BASH_PREAMBLE = '''#!/bin/bash
 # DataMesh CLI bash completion
 
+# Completion words per command path, split into a table for top-level
+# commands and one for deeper paths. Declared global (-g) because
+# bash-completion's lazy loader sources this file from inside a function.'''
+
+_BASH_FUNCTION = '''
 _datamesh_completion() {
+    # Bash can call the completion function several times for one <TAB>;
+    # reuse the reply for an identical line completed within two seconds.
+    local key="$PWD|$COMP_POINT|$COMP_LINE"
+    if [[ "$key" == "${_datamesh_cache_key-}" ]] && (( SECONDS - _datamesh_cache_time < 2 )); then
+        COMPREPLY=( "${_datamesh_cache_reply[@]}" )
+        return 0
+    fi
+    _datamesh_complete
+    _datamesh_cache_key="$key"
+    _datamesh_cache_time=$SECONDS
+    _datamesh_cache_reply=( "${COMPREPLY[@]}" )
+}
+
+# Append the words of a sorted list ($2) that start with $1 to COMPREPLY.
+# Word lists are sorted when this file is generated, so the scan stops right
+# after the last match and no compgen subshell is needed.
+_datamesh_prefix() {
+    local LC_ALL=C w
+    for w in $2; do
+        if [[ "$w" == "$1"* ]]; then
+            COMPREPLY+=( "$w" )
+        elif [[ "$w" > "$1" ]]; then
+            break
+        fi
+    done
+}
+
+_datamesh_complete() {
     local cur prev opts
     COMPREPLY=()
     cur="${COMP_WORDS[COMP_CWORD]}"
     prev="${COMP_WORDS[COMP_CWORD-1]}"
 
     # Global options
-    local global_opts="--format -f --verbose -v --no-color --config -c --interactive -i --dry-run --help -h"
+    local global_opts="%(global_opts)s"
     
     # Main commands
-    local commands="file network system governance interactive service status guide"
+    local commands="%(commands)s"
     
-    # Handle global options
+    # Handle options that take a value
     case ${prev} in
-        --format|-f)
-            COMPREPLY=( $(compgen -W "table json compact csv" -- ${cur}) )
+%(value_arms)s
+        %(path_options)s)
+            COMPREPLY=( $(compgen -f -- ${cur}) )
             return 0
             ;;
-        --config|-c)
-            COMPREPLY=( $(compgen -f -- ${cur}) )
+        %(value_options)s)
+            # Free-form value: don't offer sibling options as the value
             return 0
             ;;
     esac
@@ -237,311 +390,379 @@ _datamesh_completion() {
     local i=1
     while [[ $i -lt $COMP_CWORD ]]; do
         local word="${COMP_WORDS[$i]}"
-        if [[ ! "$word" =~ ^- ]]; then
-            if [[ -z "$cmd_path" ]]; then
-                cmd_path="$word"
-            else
-                cmd_path="$cmd_path $word"
-            fi
-        fi
+        case "$word" in
+            %(takes_value)s)
+                # The next word is this option's value, not a command
+                ((i++))
+                ;;
+            -*)
+                ;;
+            *)
+                if [[ -z "$cmd_path" ]]; then
+                    cmd_path="$word"
+                else
+                    cmd_path="$cmd_path $word"
+                fi
+                ;;
+        esac
         ((i++))
     done
     
-    # Complete based on command path
-    case "$cmd_path" in
-        "")
-            COMPREPLY=( $(compgen -W "$commands $global_opts" -- ${cur}) )
-            ;;
-        "file")
-            COMPREPLY=( $(compgen -W "put get list search batch share" -- ${cur}) )
-            ;;
-        "file put")
-            case ${prev} in
-                --name|--tags|--public-key) return 0 ;;
-                *) COMPREPLY=( $(compgen -f -- ${cur}) ) ;;
-            esac
-            ;;
-        "file get")
-            case ${prev} in
-                --output|-o) COMPREPLY=( $(compgen -f -- ${cur}) ) ;;
-                --private-key) return 0 ;;
-            esac
-            ;;
-        "file list")
-            COMPREPLY=( $(compgen -W "--tags --public-key --long" -- ${cur}) )
-            ;;
-        "file search")
-            COMPREPLY=( $(compgen -W "--content --limit" -- ${cur}) )
-            ;;
-        "file batch")
-            COMPREPLY=( $(compgen -W "put get tag" -- ${cur}) )
-            ;;
-        "file share")
-            COMPREPLY=( $(compgen -W "--with --public --expires" -- ${cur}) )
-            ;;
-        "network")
-            COMPREPLY=( $(compgen -W "peers health topology bandwidth bootstrap" -- ${cur}) )
-            ;;
-        "network peers")
-            COMPREPLY=( $(compgen -W "--long --status" -- ${cur}) )
-            ;;
-        "network health")
-            COMPREPLY=( $(compgen -W "--full --monitor" -- ${cur}) )
-            ;;
-        "network topology")
-            COMPREPLY=( $(compgen -W "--routing --output" -- ${cur}) )
-            ;;
-        "network bandwidth")
-            COMPREPLY=( $(compgen -W "--duration" -- ${cur}) )
-            ;;
-        "network bootstrap")
-            COMPREPLY=( $(compgen -W "start stop list add remove" -- ${cur}) )
-            ;;
-        "system")
-            COMPREPLY=( $(compgen -W "config stats storage api benchmark" -- ${cur}) )
-            ;;
-        "system config")
-            COMPREPLY=( $(compgen -W "show set get init validate" -- ${cur}) )
-            ;;
-        "system stats")
-            COMPREPLY=( $(compgen -W "--long --watch" -- ${cur}) )
-            ;;
-        "system storage")
-            COMPREPLY=( $(compgen -W "cleanup repair optimize quota" -- ${cur}) )
-            ;;
-        "system api")
-            COMPREPLY=( $(compgen -W "start stop status docs" -- ${cur}) )
-            ;;
-        "governance")
-            COMPREPLY=( $(compgen -W "user proposal vote economics" -- ${cur}) )
-            ;;
-        "governance user")
-            COMPREPLY=( $(compgen -W "register login profile update" -- ${cur}) )
-            ;;
-        "governance proposal")
-            COMPREPLY=( $(compgen -W "list create show" -- ${cur}) )
-            ;;
-        "governance economics")
-            COMPREPLY=( $(compgen -W "balance transfer stake history" -- ${cur}) )
-            ;;
-        "service")
-            COMPREPLY=( $(compgen -W "start stop restart status logs" -- ${cur}) )
-            ;;
-        *)
-            COMPREPLY=( $(compgen -W "$global_opts" -- ${cur}) )
-            ;;
-    esac
+    if [[ -z "$cmd_path" ]]; then
+        _datamesh_prefix "$cur" "$commands"
+        _datamesh_prefix "$cur" "$global_opts"
+        return 0
+    fi
+    
+    # Complete based on command path: one lookup in the table for its depth
+    local words
+    if [[ "$cmd_path" == *" "* ]]; then
+        words="${_datamesh_sub_words[$cmd_path]-}"
+    else
+        words="${_datamesh_top_words[$cmd_path]-}"
+    fi
+    if [[ -n "${_datamesh_files[$cmd_path]-}" ]]; then
+        _datamesh_prefix "$cur" "$words"
+        COMPREPLY+=( $(compgen -f -- ${cur}) )
+    else
+        _datamesh_prefix "$cur" "${words:-$global_opts}"
+    fi
 }
 
+# Needed both when sourced eagerly and when bash-completion loads this file
+# on demand: the lazy loader retries completion with the spec set here.
 complete -F _datamesh_completion datamesh
 '''
-    return script
 
-def generate_zsh_completion():
-    """Generate zsh completion script"""
-    script = '''#compdef datamesh
+def _bash_assoc(name, items):
+    """Format a global bash associative array declaration"""
+    lines = [f"declare -gA {name}=("]
+    lines.extend(f'    ["{key}"]="{value}"' for key, value in items)
+    lines.append(")")
+    return "\n".join(lines)
+
+def _option_names(options):
+    """Long names of options followed by their short aliases, if any"""
+    names = []
+    for option in options:
+        names.append(option)
+        short = _option_help(option)[0]
+        if short:
+            names.append(short)
+    return names
+
+def _takes_value_options():
+    """Every global and subcommand option name that is followed by a value"""
+    names = []
+    for short, long, _, value in _GLOBAL_SPECS:
+        if value is not None:
+            names.extend(name for name in (long, short) if name)
+    names.extend(_option_names(sorted(PATH_OPTIONS | VALUE_OPTIONS)))
+    return names
+
+def _bash_value_arms():
+    """Case arms completing the values of global options that take one"""
+    arms = []
+    for short, long, _, value in _GLOBAL_SPECS:
+        if value is None:
+            continue
+        if value == "file":
+            reply = "COMPREPLY=( $(compgen -f -- ${cur}) )"
+        else:
+            reply = f'_datamesh_prefix "$cur" "{" ".join(sorted(value))}"'
+        pattern = f"{long}|{short}" if short else long
+        arms.append(
+            f"        {pattern})\n"
+            f"            {reply}\n"
+            f"            return 0\n"
+            f"            ;;"
+        )
+    return "\n".join(arms)
+
+@functools.cache
+def generate_bash_completion():
+    """Generate bash completion script"""
+    top_words = []
+    sub_words = []
+    files = []
+    for command in _flat():
+        key = " ".join(command.path)
+        words = command.subcommands or command.options
+        if words:
+            table = top_words if len(command.path) == 1 else sub_words
+            table.append((key, " ".join(sorted(words))))
+        if not command.subcommands and FILE_ARGS.intersection(command.args):
+            files.append((key, 1))
+    parts = [
+        _BASH_PREAMBLE,
+        _bash_assoc("_datamesh_top_words", top_words),
+        _bash_assoc("_datamesh_sub_words", sub_words),
+        _bash_assoc("_datamesh_files", files),
+        _BASH_FUNCTION % {
+            "global_opts": _BASH_GLOBAL,
+            "commands": " ".join(sorted(COMMANDS)),
+            "value_arms": _bash_value_arms(),
+            "path_options": "|".join(_option_names(sorted(PATH_OPTIONS))),
+            "value_options": "|".join(_option_names(sorted(VALUE_OPTIONS))),
+            "takes_value": "|".join(_takes_value_options()),
+        },
+    ]
+    return "\n".join(parts)
+
+_ZSH_HEADER = '''#compdef datamesh
 
 # DataMesh CLI zsh completion
+#
+# Autoloadable completion function: each command branch lives in its own
+# _datamesh_<command> helper that is only evaluated once it is reached.
 
 _datamesh() {
     local context state line
     typeset -A opt_args
     
     local global_opts=(
-        '(-f --format)'{-f,--format}'[Output format]:format:(table json compact csv)'
-        '(-v --verbose)'{-v,--verbose}'[Verbose output]'
-        '--no-color[Disable colored output]'
-        '(-c --config)'{-c,--config}'[Configuration file]:file:_files'
-        '(-i --interactive)'{-i,--interactive}'[Interactive mode]'
-        '--dry-run[Show what would be done]'
-        '(-h --help)'{-h,--help}'[Show help]'
+%(global_opts)s
     )
     
-    _arguments -C \
-        $global_opts \
-        '1: :->commands' \
-        '*: :->args' && return 0
+    _arguments -C \\
+        $global_opts \\
+        '1: :->commands' \\
+        '*:: :->args' && return 0
     
     case $state in
         commands)
             local commands=(
-                'file:File operations'
-                'network:Network operations'
-                'system:System operations'
-                'governance:Governance operations'
-                'interactive:Start interactive shell'
-                'service:Service management'
-                'status:Show system status'
-                'guide:Getting started guide'
+%(commands)s
             )
             _describe 'commands' commands
             ;;
         args)
-            case $words[2] in
-                file)
-                    local file_commands=(
-                        'put:Store a file'
-                        'get:Retrieve a file'
-                        'list:List files'
-                        'search:Search files'
-                        'batch:Batch operations'
-                        'share:Share files'
-                    )
-                    _describe 'file commands' file_commands
-                    ;;
-                network)
-                    local network_commands=(
-                        'peers:Show peer information'
-                        'health:Network health check'
-                        'topology:Network topology'
-                        'bandwidth:Bandwidth testing'
-                        'bootstrap:Bootstrap management'
-                    )
-                    _describe 'network commands' network_commands
-                    ;;
-                system)
-                    local system_commands=(
-                        'config:Configuration management'
-                        'stats:Statistics and metrics'
-                        'storage:Storage management'
-                        'api:API server management'
-                        'benchmark:Run benchmarks'
-                    )
-                    _describe 'system commands' system_commands
-                    ;;
-                governance)
-                    local governance_commands=(
-                        'user:User management'
-                        'proposal:Proposal management'
-                        'vote:Vote on proposals'
-                        'economics:Economic operations'
-                    )
-                    _describe 'governance commands' governance_commands
-                    ;;
-                service)
-                    local service_commands=(
-                        'start:Start service'
-                        'stop:Stop service'
-                        'restart:Restart service'
-                        'status:Service status'
-                        'logs:Show service logs'
-                    )
-                    _describe 'service commands' service_commands
-                    ;;
-            esac
+            local fn="_datamesh_${words[1]}"
+            (( $+functions[$fn] )) && $fn
             ;;
     esac
 }
+'''
+
+def _zsh_function_name(path):
+    """Name of the zsh helper function completing a command path"""
+    return "_".join(["_datamesh", *path])
+
+def _zsh_global_opts():
+    """Format the global options as `_arguments` specs, one per line"""
+    lines = []
+    for short, long, description, value in _GLOBAL_SPECS:
+        if value is None:
+            action = ""
+        elif value == "file":
+            action = ":file:_files"
+        else:
+            action = f":{long[2:]}:({' '.join(value)})"
+        if short:
+            spec = f"'({short} {long})'{{{short},{long}}}'[{description}]{action}'"
+        else:
+            spec = f"'{long}[{description}]{action}'"
+        lines.append(f"        {spec}")
+    return "\n".join(lines)
+
+def _zsh_describe_items(commands):
+    """Format commands as `_describe` items, one per line"""
+    items = []
+    for command in commands:
+        name = command.path[-1]
+        item = f"{name}:{command.description}" if command.description else name
+        items.append(f"                '{item}'")
+    return "\n".join(items)
+
+def _zsh_option_spec(option):
+    """Translate a subcommand option into an `_arguments` spec"""
+    short, description, value = _option_help(option)
+    if value is None:
+        action = ""
+    elif value == "file":
+        action = ":path:_files"
+    else:
+        action = f":{value}: "
+    help_text = f"[{description}]" if description else ""
+    if short:
+        return f"'({short} {option})'{{{short},{option}}}'{help_text}{action}'"
+    return f"'{option}{help_text}{action}'"
+
+def _zsh_arg_spec(index, arg):
+    """Translate a positional argument placeholder into an `_arguments` spec"""
+    name = arg.strip("<>[].")
+    action = "_files" if arg in FILE_ARGS else " "
+    if arg.endswith("..."):
+        return f"'*:{name}:{action}'"
+    if arg.startswith("["):
+        return f"'{index}::{name}:{action}'"
+    return f"'{index}:{name}:{action}'"
+
+def _zsh_function(command, by_path):
+    """Emit the zsh helper function for one command, or None if it has nothing to complete"""
+    name = _zsh_function_name(command.path)
+    if command.subcommands:
+        return f'''{name}() {{
+    local context state line
+    _arguments -C \\
+        '1: :->commands' \\
+        '*:: :->args' && return 0
+    
+    case $state in
+        commands)
+            local commands=(
+{_zsh_describe_items(_children(command, by_path))}
+            )
+            _describe '{" ".join(command.path)} commands' commands
+            ;;
+        args)
+            local fn="{name}_${{words[1]}}"
+            (( $+functions[$fn] )) && $fn
+            ;;
+    esac
+}}
+'''
 
-_datamesh
+    specs = [_zsh_option_spec(option) for option in command.options]
+    specs.extend(
+        _zsh_arg_spec(index, arg)
+        for index, arg in enumerate(command.args, start=1)
+    )
+    if not specs:
+        return None
+    body = " \\\n        ".join(specs)
+    return f'''{name}() {{
+    _arguments \\
+        {body}
+}}
 '''
-    return script
 
+@functools.cache
+def generate_zsh_completion():
+    """Generate zsh completion script"""
+    flat = _flat()
+    by_path = {command.path: command for command in flat}
+    parts = [_ZSH_HEADER % {
+        "global_opts": _zsh_global_opts(),
+        "commands": _zsh_describe_items(c for c in flat if len(c.path) == 1),
+    }]
+    for command in flat:
+        function = _zsh_function(command, by_path)
+        if function:
+            parts.append(function)
+    parts.append('_datamesh "$@"\n')
+    return "\n".join(parts)
+
+def _fish_global_options():
+    """`complete` lines for the global options, under a header comment"""
+    lines = ["# DataMesh CLI fish completion", "", "# Global options"]
+    for short, long, description, value in _GLOBAL_SPECS:
+        line = "complete -c datamesh"
+        if short:
+            line += f" -s {short[1:]}"
+        line += f' -l {long[2:]} -d "{description}"'
+        if value == "file":
+            line += " -rF"
+        elif value is not None:
+            line += f' -xa "{" ".join(value)}"'
+        lines.append(line)
+    return "\n".join(lines)
+
+_FISH_COMMAND_PATH = '''# Command path helpers: the words typed so far, minus options and their values
+function __datamesh_command_path
+    set -l skip 0
+    set -l words (commandline -opc)
+    set -e words[1]
+    for word in $words
+        if test $skip = 1
+            set skip 0
+        else if contains -- $word %s
+            set skip 1
+        else if not string match -q -- '-*' $word
+            echo $word
+        end
+    end
+end
+
+# True when the typed command path is exactly the given words
+function __datamesh_at_command
+    set -l path (__datamesh_command_path)
+    test "$path" = "$argv"
+end
+
+# True once the typed command path starts with the given words
+function __datamesh_seen_command
+    set -l path (__datamesh_command_path)
+    set -l n (count $argv)
+    test (count $path) -ge $n; or return 1
+    test "$path[1..$n]" = "$argv"
+end'''
+
+def _fish_subcommand_lines(condition, commands):
+    """`complete` lines offering commands as subcommands under a condition"""
+    lines = []
+    for command in commands:
+        line = f'complete -c datamesh -f -n "{condition}" -a "{command.path[-1]}"'
+        if command.description:
+            line += f' -d "{command.description}"'
+        lines.append(line)
+    return lines
+
+@functools.cache
 def generate_fish_completion():
     """Generate fish completion script"""
-    script = '''# DataMesh CLI fish completion
-
-# Global options
-complete -c datamesh -s f -l format -d "Output format" -xa "table json compact csv"
-complete -c datamesh -s v -l verbose -d "Verbose output"
-complete -c datamesh -l no-color -d "Disable colored output"
-complete -c datamesh -s c -l config -d "Configuration file" -r
-complete -c datamesh -s i -l interactive -d "Interactive mode"
-complete -c datamesh -l dry-run -d "Show what would be done"
-complete -c datamesh -s h -l help -d "Show help"
-
-# Main commands
-complete -c datamesh -f -n "__fish_use_subcommand" -a "file" -d "File operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "network" -d "Network operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "system" -d "System operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "governance" -d "Governance operations"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "interactive" -d "Start interactive shell"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "service" -d "Service management"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "status" -d "Show system status"
-complete -c datamesh -f -n "__fish_use_subcommand" -a "guide" -d "Getting started guide"
-
-# File subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "put" -d "Store a file"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "get" -d "Retrieve a file"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "list" -d "List files"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "search" -d "Search files"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "batch" -d "Batch operations"
-complete -c datamesh -f -n "__fish_seen_subcommand_from file" -a "share" -d "Share files"
-
-# File put options
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from put" -l name -d "Custom file name"
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from put" -l tags -d "File tags"
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from put" -l public-key -d "Public key for encryption"
-
-# File get options
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from get" -s o -l output -d "Output path" -r
-complete -c datamesh -n "__fish_seen_subcommand_from file; and __fish_seen_subcommand_from get" -l private-key -d "Private key for decryption"
-
-# Network subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "peers" -d "Show peer information"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "health" -d "Network health check"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "topology" -d "Network topology"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "bandwidth" -d "Bandwidth testing"
-complete -c datamesh -f -n "__fish_seen_subcommand_from network" -a "bootstrap" -d "Bootstrap management"
-
-# System subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "config" -d "Configuration management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "stats" -d "Statistics and metrics"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "storage" -d "Storage management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "api" -d "API server management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from system" -a "benchmark" -d "Run benchmarks"
-
-# Governance subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "user" -d "User management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "proposal" -d "Proposal management"
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "vote" -d "Vote on proposals"
-complete -c datamesh -f -n "__fish_seen_subcommand_from governance" -a "economics" -d "Economic operations"
-
-# Service subcommands
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "start" -d "Start service"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "stop" -d "Stop service"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "restart" -d "Restart service"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "status" -d "Service status"
-complete -c datamesh -f -n "__fish_seen_subcommand_from service" -a "logs" -d "Show service logs"
-'''
-    return script
+    flat = _flat()
+    by_path = {command.path: command for command in flat}
+    top = [command for command in flat if len(command.path) == 1]
+    blocks = [
+        _fish_global_options(),
+        _FISH_COMMAND_PATH % " ".join(_takes_value_options()),
+        "\n".join(["# Main commands", *_fish_subcommand_lines("__datamesh_at_command", top)]),
+    ]
+    for command in flat:
+        title = " ".join(command.path).capitalize()
+        if command.subcommands:
+            condition = f"__datamesh_at_command {' '.join(command.path)}"
+            lines = _fish_subcommand_lines(condition, _children(command, by_path))
+            blocks.append("\n".join([f"# {title} subcommands", *lines]))
+        elif command.options:
+            lines = [f"# {title} options"]
+            path = " ".join(command.path)
+            for option in command.options:
+                short, description, value = _option_help(option)
+                line = f'complete -c datamesh -n "__datamesh_seen_command {path}"'
+                if short:
+                    line += f" -s {short[1:]}"
+                line += f" -l {option[2:]}"
+                if description:
+                    line += f' -d "{description}"'
+                if value == "file":
+                    line += " -rF"
+                elif value is not None:
+                    line += " -x"
+                lines.append(line)
+            blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
 
-def write_completion_files():
-    """Write completion files to disk"""
-    completions_dir = Path("completions")
-    completions_dir.mkdir(exist_ok=True)
-    
-    # Bash completion
-    bash_file = completions_dir / "datamesh.bash"
-    with open(bash_file, "w") as f:
-        f.write(generate_bash_completion())
-    print(f"Generated bash completion: {bash_file}")
-    
-    # Zsh completion
-    zsh_file = completions_dir / "_datamesh"
-    with open(zsh_file, "w") as f:
-        f.write(generate_zsh_completion())
-    print(f"Generated zsh completion: {zsh_file}")
-    
-    # Fish completion
-    fish_file = completions_dir / "datamesh.fish"
-    with open(fish_file, "w") as f:
-        f.write(generate_fish_completion())
-    print(f"Generated fish completion: {fish_file}")
-    
-    # Installation instructions
-    install_file = completions_dir / "INSTALL.md"
-    with open(install_file, "w") as f:
-        f.write("""# Shell Completion Installation
+# Installation instructions written next to the completion files
+_INSTALL_MD = """# Shell Completion Installation
 
 ## Bash
-Copy the bash completion file to your bash completions directory:
+Copy the bash completion file to a bash-completion completions directory.
+Files there are loaded on demand the first time you press `<TAB>` after
+`datamesh`, so shells that never complete `datamesh` don't source it:
 ```bash
-# On most Linux systems:
-sudo cp datamesh.bash /etc/bash_completion.d/
-# Or user-specific:
+# User-specific:
 mkdir -p ~/.local/share/bash-completion/completions
-cp datamesh.bash ~/.local/share/bash-completion/completions/datamesh
+cp datamesh ~/.local/share/bash-completion/completions/datamesh
+# Or system-wide:
+sudo cp datamesh "$(pkg-config --variable=completionsdir bash-completion)/datamesh"
+```
+
+Legacy setups without on-demand loading can still install it in
+`/etc/bash_completion.d/`, which is sourced eagerly by every interactive shell:
+```bash
+sudo cp datamesh /etc/bash_completion.d/datamesh
 ```
 
 ## Zsh
@@ -549,13 +770,24 @@ Copy the zsh completion file to your zsh completions directory:
 ```bash
 # Add to your .zshrc:
 fpath=(~/.local/share/zsh/completions $fpath)
-autoload -U compinit && compinit
+autoload -U compinit && compinit -C
 
 # Copy the completion file:
 mkdir -p ~/.local/share/zsh/completions
 cp _datamesh ~/.local/share/zsh/completions/
 ```
 
+`_datamesh` is an autoloadable function, so it can be compiled to zsh
+bytecode. New shells then map the `.zwc` files instead of re-parsing the
+completion sources on every startup:
+```zsh
+zcompile -U ~/.local/share/zsh/completions/_datamesh
+zcompile -U ~/.zcompdump
+```
+`compinit -C` skips re-scanning `$fpath` when `~/.zcompdump` already exists.
+After updating `_datamesh`, remove `~/.zcompdump*` and the `.zwc` files, then
+run `compinit` and the `zcompile` steps again.
+
 ## Fish
 Copy the fish completion file to your fish completions directory:
 ```bash
@@ -571,8 +803,34 @@ datamesh <TAB>
 datamesh file <TAB>
 datamesh network <TAB>
 ```
-""")
-    print(f"Generated installation instructions: {install_file}")
+"""
+
+def write_completion_files():
+    """Write completion files to disk"""
+    completions_dir = Path("completions")
+    completions_dir.mkdir(exist_ok=True)
+    
+    # Named after the command so bash-completion's lazy loader can find it
+    bash_file = completions_dir / "datamesh"
+    zsh_file = completions_dir / "_datamesh"
+    fish_file = completions_dir / "datamesh.fish"
+    install_file = completions_dir / "INSTALL.md"
+    
+    # Every target is a distinct file, so the writes can overlap
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(bash_file.write_text, generate_bash_completion(), encoding="utf-8"):
+                f"Generated bash completion: {bash_file}",
+            executor.submit(zsh_file.write_text, generate_zsh_completion(), encoding="utf-8"):
+                f"Generated zsh completion: {zsh_file}",
+            executor.submit(fish_file.write_text, generate_fish_completion(), encoding="utf-8"):
+                f"Generated fish completion: {fish_file}",
+            executor.submit(install_file.write_text, _INSTALL_MD, encoding="utf-8"):
+                f"Generated installation instructions: {install_file}",
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(futures[future])
 
 if __name__ == "__main__":
     write_completion_files()